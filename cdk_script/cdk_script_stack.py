@@ -1,5 +1,7 @@
 # Import required AWS CDK core constructs
-from aws_cdk import Stack, CfnOutput
+import os
+import jsii
+from aws_cdk import Stack, CfnOutput, Lazy, IStableStringProducer, Tags, aws_lambda as lambda_
 # Import the base Construct class
 from constructs import Construct
 # Import our custom stack modules
@@ -8,68 +10,108 @@ from .stacks.ecr_stack import ECRStack             # Container registry componen
 from .stacks.database_stack import DatabaseStack    # RDS and Redis components
 from .stacks.application_stack import ApplicationStack  # ECS/Fargate components
 from .stacks.WebsiteScrapingStack import WebsiteScrappingStack
-from .utils.alarms import create_alarm_topic, create_cost_alarms
-from .config import get_project_name, get_alarm_config  # Configuration utilities
+from .utils.alarms import create_cost_alarms
+from .config import get_project_name, get_alarm_config, get_pinecone_config  # Configuration utilities
 from .stacks.FileUploadStack import FileUploadStack
+
+# Lambda handler sources shared by the scraping and file upload functions.
+# An AssetCode can only be bound to one stack, so each Lambda stack gets its own
+# Code pointing at this path; CDK's asset staging cache then fingerprints the
+# directory only once.
+LAMBDA_ASSET_PATH = os.path.join(os.path.dirname(__file__), "static")
+
+@jsii.implements(IStableStringProducer)
+class _StableValue:
+    """Producer for Lazy.string so an output value is resolved once and cached"""
+    def __init__(self, value: str) -> None:
+        self._value = value
+
+    def produce(self) -> str:
+        return self._value
+
+
 class CdkScriptStack(Stack):
     """
     Main CDK Stack that orchestrates all sub-stacks and their dependencies.
     This stack is responsible for creating and connecting all infrastructure components.
     """
-    def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
+    def __init__(self, scope: Construct, construct_id: str, env_name: str, **kwargs) -> None:
         # Initialize the parent Stack class
         super().__init__(scope, construct_id, **kwargs)
 
         # Retrieve deployment environment configuration from CDK context
         # These values can be overridden during deployment using cdk.json or --context flag
-        env_name = self.node.try_get_context("env_name") or "dev"  # Environment name (dev/staging/prod)
+        # (env_name is resolved by app.py from --context env=...)
         aws_region = self.node.try_get_context("aws_region") or "us-east-1"  # AWS region to deploy to
 
         project_name = get_project_name(self)
         alarm_config = get_alarm_config(self, env_name)
+        pinecone_config = get_pinecone_config(self, env_name)
+        prefix = f"{project_name}-{env_name}-"  # Shared construct id/name prefix
+        # Sub-stacks deploy to the same account/region as this stack; cross-stack
+        # references and context lookups need them to share one environment
+        stack_env = kwargs.get("env")
 
-        # Create SNS topic for alarms
-        alarm_topic = create_alarm_topic(self, project_name, env_name)
-        
-        # Create cost alarms
-        create_cost_alarms(self, project_name, env_name, alarm_config, alarm_topic)
+        # Tag every taggable resource in this stack and all sub-stacks in one pass
+        Tags.of(self).add("Environment", env_name)
+        Tags.of(self).add("Project", project_name)
 
         # Step 1: Create the Network Stack
         # This must be created first as all other stacks depend on the VPC
+        # and on the alarm topic it owns
         network_stack = NetworkStack(
             self,  # Parent construct (this stack)
-            f"{project_name}-{env_name}-NetworkStack",  # Unique identifier for this stack
-            env_name=env_name  # Pass environment name for resource naming
+            prefix + "NetworkStack",  # Unique identifier for this stack
+            env_name=env_name,  # Pass environment name for resource naming
+            project_name=project_name,  # Pass resolved project name
+            alarm_config=alarm_config,  # Pass resolved alarm thresholds
+            env=stack_env  # Same account/region as this stack
         )
 
+        # Create cost alarms
+        create_cost_alarms(self, project_name, env_name, alarm_config, network_stack.alarm_topic)
+
         # Step 2: Create the ECR Stack
         # This creates the container registry for storing Docker images
         ecr_stack = ECRStack(
             self,  # Parent construct (this stack)
-            f"{project_name}-{env_name}-ECRStack",  # Unique identifier for this stack
-            env_name=env_name  # Pass environment name for resource naming
+            prefix + "ECRStack",  # Unique identifier for this stack
+            env_name=env_name,  # Pass environment name for resource naming
+            env=stack_env  # Same account/region as this stack
         )
 
-        # Step 3: Create the Application Stack
-        # We create this before the database stack because we need its security group
-        # for the database stack's security group rules
-        app_stack = ApplicationStack(
+        # Step 3: Create the Database Stack
+        # This creates both RDS and Redis instances with proper security group rules
+        database_stack = DatabaseStack(
             self,  # Parent construct (this stack)
-            f"{project_name}-{env_name}-AppStack",  # Unique identifier for this stack
+            prefix + "DatabaseStack",  # Unique identifier for this stack
             env_name=env_name,  # Pass environment name for resource naming
             vpc=network_stack.vpc,  # Pass VPC from network stack
-            ecr_repository=ecr_stack.repository  # Pass ECR repository from ECR stack
+            # Pass the application's security group (owned by the network stack) for
+            # creating ingress rules, so this stack never depends on the app stack
+            app_security_group=network_stack.app_security_group,
+            project_name=project_name,  # Pass resolved project name
+            alarm_config=alarm_config,  # Pass resolved alarm thresholds
+            alarm_topic=network_stack.alarm_topic,  # Topic owned by the network stack
+            env=stack_env  # Same account/region as this stack
         )
 
-        # Step 4: Create the Database Stack
-        # This creates both RDS and Redis instances with proper security group rules
-        database_stack = DatabaseStack(
+        # Step 4: Create the Application Stack
+        # Created after the database stack because its containers consume the
+        # database endpoints (see step 5)
+        app_stack = ApplicationStack(
             self,  # Parent construct (this stack)
-            f"{project_name}-{env_name}-DatabaseStack",  # Unique identifier for this stack
+            prefix + "AppStack",  # Unique identifier for this stack
             env_name=env_name,  # Pass environment name for resource naming
             vpc=network_stack.vpc,  # Pass VPC from network stack
-            # Pass the application's security group for creating ingress rules
-            app_security_group=app_stack.fargate_service.service.connections.security_groups[0]
+            app_security_group=network_stack.app_security_group,  # Security group for the tasks
+            ecr_repository=ecr_stack.repository,  # Pass ECR repository from ECR stack
+            project_name=project_name,  # Pass resolved project name
+            alarm_config=alarm_config,  # Pass resolved alarm thresholds
+            # Topic owned by the network stack, which deploys before this one; never
+            # hand children constructs owned by this aggregating parent stack
+            alarm_topic=network_stack.alarm_topic,
+            env=stack_env  # Same account/region as this stack
         )
 
         # Step 5: Configure the Application Stack with Database Information
@@ -80,55 +122,56 @@ class CdkScriptStack(Stack):
             redis_port=database_stack.redis_cluster.attr_redis_endpoint_port  # Redis port
         )
 
+        # Stacks are built sequentially on purpose: every construct call goes through
+        # the single jsii kernel process, which is not safe to drive from several
+        # threads, and FileUploadStack needs the scraping stack's WebSocket API.
         web_scrapping_stack = WebsiteScrappingStack(self,
-                                            f"{project_name}-{env_name}-WebsiteScrappingStack", 
+                                            prefix + "WebsiteScrappingStack", 
                                             marti_vpc = network_stack.vpc, 
                                             database_stack = database_stack, 
-                                            env=env_name)
+                                            code=lambda_.Code.from_asset(LAMBDA_ASSET_PATH),
+                                            env_name=env_name,
+                                            project_name=project_name,
+                                            pinecone_config=pinecone_config,
+                                            env=stack_env)
 
         file_upload_stack = FileUploadStack(self,
-                                            f"{project_name}-{env_name}-FileUploadStack", 
+                                            prefix + "FileUploadStack", 
                                             marti_vpc = network_stack.vpc, 
                                             database_stack = database_stack, 
-                                            env=env_name)
+                                            webscrapping_stack = web_scrapping_stack,
+                                            code=lambda_.Code.from_asset(LAMBDA_ASSET_PATH),
+                                            env_name=env_name,
+                                            project_name=project_name,
+                                            pinecone_config=pinecone_config,
+                                            env=stack_env)
+
+        # Declare stack ordering explicitly instead of leaving CDK to infer it
+        # from cross-stack token references
+        database_stack.add_dependency(network_stack)
+        app_stack.add_dependency(network_stack)
+        app_stack.add_dependency(ecr_stack)
+        app_stack.add_dependency(database_stack)  # Reads the database endpoints and secret
+        web_scrapping_stack.add_dependency(database_stack)
+        file_upload_stack.add_dependency(database_stack)
+        file_upload_stack.add_dependency(web_scrapping_stack)  # Routes on the scraping WebSocket API
 
         # Step 6: Create CloudFormation Outputs
         # These values will be displayed after stack deployment
-        
-        # Output the ECR repository URI for pushing Docker images
-        CfnOutput(
-            self,
-            "ECRRepositoryURI",
-            value=ecr_stack.repository.repository_uri,
-            description="ECR Repository URI"
-        )
-
-        # Output the Redis endpoint for application configuration
-        CfnOutput(
-            self,
-            "RedisEndpoint",
-            value=database_stack.redis_cluster.attr_redis_endpoint_address,
-            description="Redis Cluster Endpoint"
-        )
-
-        # Output the RDS endpoint for application configuration
-        CfnOutput(
-            self,
-            "RDSEndpoint",
-            value=database_stack.rds_instance.instance_endpoint.hostname,
-            description="RDS Instance Endpoint"
-        )
-        
-        CfnOutput(
-            self,
-            "WebsiteScrapingStack",
-            value=web_scrapping_stack.create_job_lambda.function_name,
-            description="Website Scraping Stack"
-        )
-
-        CfnOutput(
-            self,
-            "FileUploadStack",
-            value=file_upload_stack.pdf_function.function_name,
-            description="File Upload Stack"
-        )
\ No newline at end of file
+        # Values are wrapped in cached Lazy tokens so repeated resolution reuses them
+        outputs = [
+            # ECR repository URI for pushing Docker images
+            ("ECRRepositoryURI", ecr_stack.repository.repository_uri, "ECR Repository URI"),
+            # Redis and RDS endpoints for application configuration
+            ("RedisEndpoint", database_stack.redis_cluster.attr_redis_endpoint_address, "Redis Cluster Endpoint"),
+            ("RDSEndpoint", database_stack.rds_instance.instance_endpoint.hostname, "RDS Instance Endpoint"),
+            ("WebsiteScrapingStack", web_scrapping_stack.create_job_lambda.function_name, "Website Scraping Stack"),
+            ("FileUploadStack", file_upload_stack.pdf_function.function_name, "File Upload Stack"),
+        ]
+        for output_id, value, description in outputs:
+            CfnOutput(
+                self,
+                output_id,
+                value=Lazy.string(_StableValue(value)),
+                description=description
+            )
@@ -1,13 +1,37 @@
+import functools
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from constructs import Construct
 
-@dataclass
+# Resolved context lookups, keyed on the app root so each synth walks the
+# context tree once per (getter, environment) pair. Entries keep the root they
+# were resolved for, so a new App that reuses a freed root's id() misses.
+_config_cache: Dict[Tuple[Any, ...], Tuple[Any, Any]] = {}
+
+def clear_config_cache() -> None:
+    """Drop memoized context lookups (call when a new App is created)"""
+    _config_cache.clear()
+
+def _cached_per_app(func):
+    """Memoize a config getter on (getter, id(scope.node.root), *args)"""
+    @functools.wraps(func)
+    def wrapper(scope: Construct, *args, **kwargs):
+        root = scope.node.root
+        key = (func.__name__, id(root)) + args + tuple(sorted(kwargs.items()))
+        cached = _config_cache.get(key)
+        if cached is None or cached[0] is not root:
+            cached = _config_cache[key] = (root, func(scope, *args, **kwargs))
+        return cached[1]
+    return wrapper
+
+@dataclass(frozen=True, slots=True)
 class NetworkConfig:
     max_azs: int
     nat_gateways: int
+    use_existing_vpc: bool = False
+    vpc_id: Optional[str] = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HealthCheckConfig:
     path: str
     interval: int
@@ -15,14 +39,14 @@ class HealthCheckConfig:
     healthy_count: int
     unhealthy_count: int
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScalingConfig:
     cpu_target_utilization: int
     requests_per_target: int
     scale_in_cooldown: int
     scale_out_cooldown: int
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ApplicationConfig:
     container_insights: bool
     task_cpu: int
@@ -35,19 +59,19 @@ class ApplicationConfig:
     scaling: ScalingConfig
     database_name: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EcrConfig:
     repository_name: str
     max_image_count: int
     enable_scan: bool
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RedisConfig:
     node_type: str
     num_nodes: int
     port: int 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RdsConfig:
     instance_type: str
     allocated_storage: int
@@ -58,33 +82,36 @@ class RdsConfig:
     port: int 
     deletion_protection: bool = False
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
     redis: RedisConfig
     rds: RdsConfig
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AlarmConfig:
     costs: Dict[str, Any]
     rds: Dict[str, Any]
     redis: Dict[str, Any]
     ecs: Dict[str, Any]
+    network: Dict[str, Any]
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CleanupConfig:
     rds: Dict[str, Any]
     redis: Dict[str, Any]
     ecr: Dict[str, Any]
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PineconeConfig:
     api_key: str
     index_name: str
 
+@_cached_per_app
 def get_cleanup_config(scope: Construct, env_name: str) -> CleanupConfig:
     config = get_env_config(scope, env_name)
     return CleanupConfig(**config["cleanup"])
 
+@_cached_per_app
 def get_project_name(scope: Construct) -> str:
     """Get project name from context"""
     environments = scope.node.try_get_context("environments")
@@ -92,6 +119,7 @@ def get_project_name(scope: Construct) -> str:
         raise ValueError("Project name not found in context")
     return environments["projectName"]
 
+@_cached_per_app
 def get_env_config(scope: Construct, env_name: str = "dev") -> Dict[str, Any]:
     """Get environment specific configuration from context"""
     environments = scope.node.try_get_context("environments")
@@ -104,13 +132,25 @@ def get_env_config(scope: Construct, env_name: str = "dev") -> Dict[str, Any]:
     
     return env_config
 
+@_cached_per_app
 def get_network_config(scope: Construct, env_name: str) -> NetworkConfig:
     config = get_env_config(scope, env_name)
-    return NetworkConfig(**config["network"])
+    network_config = config["network"]
+    if network_config.get("useExistingVpc", False) and not network_config.get("vpcId"):
+        raise ValueError(f"network.useExistingVpc requires network.vpcId for environment: {env_name}")
+    return NetworkConfig(
+        max_azs=network_config["maxAzs"],
+        nat_gateways=network_config["natGateways"],
+        use_existing_vpc=network_config.get("useExistingVpc", False),
+        vpc_id=network_config.get("vpcId")
+    )
 
+@_cached_per_app
 def get_application_config(scope: Construct, env_name: str) -> ApplicationConfig:
     config = get_env_config(scope, env_name)
     app_config = config["application"]
+    health_check = app_config["healthCheck"]
+    scaling = app_config["scaling"]
     return ApplicationConfig(
         container_insights=app_config["containerInsights"],
         task_cpu=app_config["taskCpu"],
@@ -119,23 +159,66 @@ def get_application_config(scope: Construct, env_name: str) -> ApplicationConfig
         desired_count=app_config["desiredCount"],
         min_tasks=app_config["minTasks"],
         max_tasks=app_config["maxTasks"],
-        health_check=HealthCheckConfig(**app_config["healthCheck"]),
-        scaling=ScalingConfig(**app_config["scaling"]),
-        database_name=app_config["database"]["name"]
+        health_check=HealthCheckConfig(
+            path=health_check["path"],
+            interval=health_check["interval"],
+            timeout=health_check["timeout"],
+            healthy_count=health_check["healthyCount"],
+            unhealthy_count=health_check["unhealthyCount"]
+        ),
+        scaling=ScalingConfig(
+            cpu_target_utilization=scaling["cpuTargetUtilization"],
+            requests_per_target=scaling["requestsPerTarget"],
+            scale_in_cooldown=scaling["scaleInCooldown"],
+            scale_out_cooldown=scaling["scaleOutCooldown"]
+        ),
+        database_name=app_config["database"]["rds"]["databaseName"]
     )
 
+@_cached_per_app
 def get_ecr_config(scope: Construct, env_name: str) -> EcrConfig:
     config = get_env_config(scope, env_name)
-    return EcrConfig(**config["ecr"])
+    ecr_config = config["ecr"]
+    return EcrConfig(
+        repository_name=ecr_config["repositoryName"],
+        max_image_count=ecr_config["maxImageCount"],
+        enable_scan=ecr_config["enableScan"]
+    )
 
+@_cached_per_app
 def get_database_config(scope: Construct, env_name: str) -> DatabaseConfig:
     config = get_env_config(scope, env_name)
-    return DatabaseConfig(**config["database"]) 
+    db_config = config["application"]["database"]
+    redis_config = db_config["redis"]
+    rds_config = db_config["rds"]
+    return DatabaseConfig(
+        redis=RedisConfig(
+            node_type=redis_config["nodeType"],
+            num_nodes=redis_config["numNodes"],
+            port=redis_config["port"]
+        ),
+        rds=RdsConfig(
+            instance_type=rds_config["instanceType"],
+            allocated_storage=rds_config["allocatedStorage"],
+            max_allocated_storage=rds_config["maxAllocatedStorage"],
+            multi_az=rds_config["multiAz"],
+            backup_retention_days=rds_config["backupRetentionDays"],
+            database_name=rds_config["databaseName"],
+            port=rds_config["port"],
+            deletion_protection=rds_config.get("deletionProtection", False)
+        )
+    )
 
+@_cached_per_app
 def get_alarm_config(scope: Construct, env_name: str) -> AlarmConfig:
     config = get_env_config(scope, env_name)
     return AlarmConfig(**config["alarms"]) 
 
+@_cached_per_app
 def get_pinecone_config(scope: Construct, env_name: str) -> PineconeConfig:
     config = get_env_config(scope, env_name)
-    return PineconeConfig(**config["pinecone"]) 
\ No newline at end of file
+    pinecone_config = config["application"]["database"]["pinecone"]
+    return PineconeConfig(
+        api_key=pinecone_config["apiKey"],
+        index_name=pinecone_config["indexName"]
+    ) 
\ No newline at end of file
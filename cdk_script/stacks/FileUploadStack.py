@@ -8,46 +8,57 @@ from aws_cdk import (
     aws_apigatewayv2 as apigatewayv2,
     CfnOutput
 )
-from aws_cdk import aws_apigateway as apigateway
 from constructs import Construct
 import aws_cdk.aws_s3 as s3
 from aws_cdk import RemovalPolicy
-from config import get_database_config, get_env_config, get_project_name, get_pinecone_config
+from ..config import get_database_config, PineconeConfig
 
 class FileUploadStack(Stack):
-    def __init__(self, scope: Construct, construct_id: str, marti_vpc: ec2.Vpc, DatabaseStack, webscrapping_stack,**kwargs) -> None:
+    def __init__(
+        self,
+        scope: Construct,
+        construct_id: str,
+        marti_vpc: ec2.IVpc,
+        database_stack,
+        webscrapping_stack,
+        code: lambda_.Code,
+        env_name: str,
+        project_name: str,
+        pinecone_config: PineconeConfig,
+        **kwargs
+    ) -> None:
         super().__init__(scope, construct_id, **kwargs)
+        prefix = f"{project_name}-{env_name}-"  # Shared construct id/name prefix
 
-        env_name = get_env_config()
         config = get_database_config(scope, env_name)
-        # Access RDS and Redis connection details
-        rds_endpoint = config.database.rds.port
-        redis_endpoint = config.database.redis.port
+        # Access RDS and Redis connection details (Lambda environment values must be strings)
+        rds_endpoint = database_stack.rds_instance.instance_endpoint.hostname
+        redis_endpoint = database_stack.redis_cluster.attr_redis_endpoint_address
+        redis_port = str(config.redis.port)
 
-        project_name = get_project_name()
-        pinecone_config = get_pinecone_config(scope, env_name)
         s3_bucket = s3.Bucket(
             self, 
-            f"{project_name}-{env_name}-FileUploadBucket",
+            prefix + "FileUploadBucket",
             removal_policy=RemovalPolicy.DESTROY,
             auto_delete_objects=True 
         )
         
         pdf_function = lambda_.Function(
             self, 
-            f"{project_name}-{env_name}-PdfFileLambda",
+            prefix + "PdfFileLambda",
             runtime=lambda_.Runtime.PYTHON_3_9,
             handler="uploadfile.pdf_file",
-            code=lambda_.Code.from_asset("./static"),
+            code=code,
             vpc=marti_vpc,
             environment={
                 "RDS_ENDPOINT": rds_endpoint,
                 "REDIS_ENDPOINT": redis_endpoint,
-                "REDIS_PORT": config.database.redis.port,  # Default Redis port
+                "REDIS_PORT": redis_port,  # Default Redis port
                 "PINECONE_API_KEY": pinecone_config.api_key,  # Add your API key here
                 "PINECONE_INDEX_NAME": pinecone_config.index_name      # Add your index name here
             }
         )
+        self.pdf_function = pdf_function
         
         # Grant the Lambda permission to read from the S3 bucket
         s3_bucket.grant_read(pdf_function)
@@ -61,37 +72,45 @@ class FileUploadStack(Stack):
         # Reference the WebSocket API Gateway from the WebsiteScrappingStack
         websocket_api = webscrapping_stack.websocket_api
 
-        # Lambda Integration for WebSocket API
-        lambda_integration = apigateway.LambdaIntegration(pdf_function)
+        # Lambda integration must exist before the route that targets it
+        lambda_integration = apigatewayv2.CfnIntegration(
+            self,
+            prefix + "PdfWebSocketIntegration",
+            api_id=websocket_api.ref,
+            integration_type="AWS_PROXY",
+            integration_uri=pdf_function.function_arn,
+        )
 
         # Add route to the existing WebSocket API (same as WebScraping)
         pdf_route = apigatewayv2.CfnRoute(
             self,
-            f"{project_name}-{env_name}-PdfRoute",
+            prefix + "PdfRoute",
             api_id=websocket_api.ref,
             route_key="process-pdf",  
             authorization_type="NONE", 
-            target=f"integrations/{lambda_integration.node.id}",
+            target=f"integrations/{lambda_integration.ref}",
         )
 
+        websocket_api_arn = f"arn:aws:execute-api:{self.region}:{self.account}:{websocket_api.ref}/*"
+
         # Grant the Lambda function permission to be invoked by the API Gateway
         pdf_function.add_permission(
-            f"{project_name}-{env_name}-WebSocketInvokePermission",
-            principal=apigateway.ServicePrincipal("apigateway.amazonaws.com"),
-            source_arn=f"arn:aws:execute-api:{self.region}:{self.account}:{websocket_api.ref}/*"
+            prefix + "WebSocketInvokePermission",
+            principal=iam.ServicePrincipal("apigateway.amazonaws.com"),
+            source_arn=websocket_api_arn
         )
 
         # Add necessary policies to the Lambda function to access the WebSocket API
         pdf_function.add_to_role_policy(
             iam.PolicyStatement(
                 actions=["execute-api:ManageConnections"],
-                resources=[f"arn:aws:execute-api:{self.region}:{self.account}:{websocket_api.ref}/*"]
+                resources=[websocket_api_arn]
             )
         )
 
         CfnOutput(
             self, 
-            f"{project_name}-{env_name}-PdfApiEndpoint",
+            prefix + "PdfApiEndpoint",
             value=websocket_api.attr_api_endpoint,
             description="Endpoint for PDF processing API"
         )
\ No newline at end of file
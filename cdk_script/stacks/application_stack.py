@@ -2,14 +2,16 @@ from aws_cdk import (
     Stack,
     aws_ecs as ecs,
     aws_ec2 as ec2,
+    aws_ecr as ecr,
     aws_ecs_patterns as ecs_patterns,
     Duration,
     CfnOutput,
+    Token,
     aws_sns as sns,
 )
 from constructs import Construct
 from ..utils.alarms import create_ecs_alarms
-from ..config import get_project_name, get_alarm_config,get_application_config
+from ..config import get_application_config, AlarmConfig
 
 class ApplicationStack(Stack):
     """
@@ -22,7 +24,11 @@ class ApplicationStack(Stack):
         construct_id: str, 
         env_name: str,
         vpc: ec2.Vpc,
-        ecr_repository,
+        app_security_group: ec2.ISecurityGroup,
+        ecr_repository: ecr.IRepository,
+        project_name: str,
+        alarm_config: AlarmConfig,
+        alarm_topic: sns.ITopic,
         **kwargs
     ) -> None:
         # Initialize the parent Stack class
@@ -30,45 +36,47 @@ class ApplicationStack(Stack):
 
         # Get configuration from context
         config = get_application_config(scope, env_name)
-        project_name = get_project_name(scope)
-        alarm_config = get_alarm_config(scope, env_name)
+        prefix = f"{project_name}-{env_name}-"  # Shared construct id/name prefix
+
+        # Snapshot nested config sections used repeatedly below
+        health_check = config.health_check
+        scaling_config = config.scaling
+        container_port = config.container_port
+        health_check_interval = Duration.seconds(health_check.interval)
+        health_check_timeout = Duration.seconds(health_check.timeout)
+        scale_in_cooldown = Duration.seconds(scaling_config.scale_in_cooldown)
+        scale_out_cooldown = Duration.seconds(scaling_config.scale_out_cooldown)
         
-        # Get the alarm topic
-        alarm_topic = sns.Topic.from_topic_arn(
-            self,
-            f"{project_name}-{env_name}-alarm-topic",
-            f"arn:aws:sns:{self.region}:{self.account}:{project_name}-{env_name}-alarms"
-        )
-
         # Create ECS Cluster
         self.cluster = ecs.Cluster(
             self,  # Parent construct (this stack)
-            f"{project_name}-{env_name}-Cluster",  # Unique identifier for this cluster
+            prefix + "Cluster",  # Unique identifier for this cluster
             vpc=vpc,  # VPC to place the cluster in
-            cluster_name=f"{project_name}-{env_name}-cluster",  # Physical cluster name
+            cluster_name=prefix + "cluster",  # Physical cluster name
             container_insights=config.container_insights  # Enable/disable Container Insights
         )
 
         # Create Fargate Task Definition
         self.task_definition = ecs.FargateTaskDefinition(
             self,  # Parent construct (this stack)
-            f"{project_name}-{env_name}-TaskDef",  # Unique identifier for this task definition
+            prefix + "TaskDef",  # Unique identifier for this task definition
             memory_limit_mib=config.task_memory,  # Task memory limit
             cpu=config.task_cpu,  # Task CPU units
         )
 
         # Add Container to Task Definition
         self.container = self.task_definition.add_container(
-            f"{project_name}-{env_name}-Container",  # Container name
-            image=ecs.ContainerImage.from_registry("nginx:latest"),  # Use nginx as placeholder
-            memory_limit_mib=config.task_memory,  # Container memory limit
-            cpu=config.task_cpu,  # Container CPU units
+            prefix + "Container",  # Container name
+            image=ecs.ContainerImage.from_ecr_repository(
+                ecr_repository,  # Image pushed to this environment's ECR repository
+                tag=self.node.try_get_context("image_tag") or "latest"  # Override with --context image_tag=...
+            ),
             environment={
                 "ENV": env_name,  # Environment name
                 "DB_NAME": config.database_name  # Database name
             },
             logging=ecs.LogDrivers.aws_logs(
-                stream_prefix=f"{project_name}-{env_name}-container"  # CloudWatch logs prefix
+                stream_prefix=prefix + "container"  # CloudWatch logs prefix
             ),
             health_check=ecs.HealthCheck(
                 command=["CMD-SHELL", "curl -f http://localhost/ || exit 1"],
@@ -81,7 +89,7 @@ class ApplicationStack(Stack):
         # Add Port Mapping
         self.container.add_port_mappings(
             ecs.PortMapping(
-                container_port=config.container_port,  # Port the container listens on
+                container_port=container_port,  # Port the container listens on
                 protocol=ecs.Protocol.TCP  # Protocol to use
             )
         )
@@ -89,14 +97,15 @@ class ApplicationStack(Stack):
         # Create Fargate Service with Load Balancer
         self.fargate_service = ecs_patterns.ApplicationLoadBalancedFargateService(
             self,  # Parent construct (this stack)
-            f"{project_name}-{env_name}-Service",  # Unique identifier for this service
+            prefix + "Service",  # Unique identifier for this service
             cluster=self.cluster,  # ECS cluster to run in
             task_definition=self.task_definition,  # Task definition to use
             desired_count=config.desired_count,  # Number of tasks to run
-            service_name=f"{project_name}-{env_name}-service",  # Physical service name
+            service_name=prefix + "service",  # Physical service name
             public_load_balancer=True,  # Internet-facing load balancer
-            listener_port=config.container_port,  # Port the load balancer listens on
+            listener_port=container_port,  # Port the load balancer listens on
             assign_public_ip=False,  # Use private IPs for tasks
+            security_groups=[app_security_group],  # Shared group owned by the network stack
             vpc_subnets=ec2.SubnetSelection(
                 subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS  # Use private subnets
             )
@@ -104,17 +113,17 @@ class ApplicationStack(Stack):
 
         # Configure health checks
         self.fargate_service.target_group.configure_health_check(
-            path=config.health_check.path,  # Health check endpoint
+            path=health_check.path,  # Health check endpoint
             healthy_http_codes="200",  # Expected response code
-            interval=Duration.seconds(config.health_check.interval),  # Check interval
-            timeout=Duration.seconds(config.health_check.timeout),  # Check timeout
-            healthy_threshold_count=config.health_check.healthy_count,  # Success threshold
-            unhealthy_threshold_count=config.health_check.unhealthy_count  # Failure threshold
+            interval=health_check_interval,  # Check interval
+            timeout=health_check_timeout,  # Check timeout
+            healthy_threshold_count=health_check.healthy_count,  # Success threshold
+            unhealthy_threshold_count=health_check.unhealthy_count  # Failure threshold
         )
 
         # Configure security for the load balancer
         self.fargate_service.load_balancer.connections.allow_from_any_ipv4(
-            ec2.Port.tcp(config.container_port),  # Allow inbound traffic on container port
+            ec2.Port.tcp(container_port),  # Allow inbound traffic on container port
             description="Allow inbound HTTP traffic"
         )
 
@@ -127,15 +136,15 @@ class ApplicationStack(Stack):
         # Scale based on CPU utilization
         scaling.scale_on_cpu_utilization(
             "CpuScaling",  # Unique identifier for this scaling rule
-            target_utilization_percent=config.scaling.cpu_target_utilization,  # CPU utilization target
-            scale_in_cooldown=Duration.seconds(config.scaling.scale_in_cooldown),  # Scale in cooldown
-            scale_out_cooldown=Duration.seconds(config.scaling.scale_out_cooldown)  # Scale out cooldown
+            target_utilization_percent=scaling_config.cpu_target_utilization,  # CPU utilization target
+            scale_in_cooldown=scale_in_cooldown,  # Scale in cooldown
+            scale_out_cooldown=scale_out_cooldown  # Scale out cooldown
         )
 
         # Scale based on request count
         scaling.scale_on_request_count(
             "RequestCountScaling",  # Unique identifier for this scaling rule
-            requests_per_target=config.scaling.requests_per_target,  # Request count target
+            requests_per_target=scaling_config.requests_per_target,  # Request count target
             target_group=self.fargate_service.target_group  # Target group to monitor
         )
 
@@ -168,7 +177,7 @@ class ApplicationStack(Stack):
         """Method to update container with database configuration after database stack is created"""
         # Add RDS configuration
         self.container.add_environment("DB_HOST", rds_instance.instance_endpoint.hostname)
-        self.container.add_environment("DB_PORT", str(rds_instance.instance_endpoint.port))
+        self.container.add_environment("DB_PORT", Token.as_string(rds_instance.instance_endpoint.port))  # Numeric token
         self.container.add_secret(
             "DB_CREDENTIALS",
             ecs.Secret.from_secrets_manager(rds_instance.secret)
@@ -176,4 +185,4 @@ class ApplicationStack(Stack):
 
         # Add Redis configuration
         self.container.add_environment("REDIS_ENDPOINT", redis_endpoint)
-        self.container.add_environment("REDIS_PORT", redis_port) 
\ No newline at end of file
+        self.container.add_environment("REDIS_PORT", redis_port)  # Already a string attribute 
\ No newline at end of file
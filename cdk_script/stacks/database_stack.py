@@ -3,15 +3,31 @@ from aws_cdk import (
     aws_ec2 as ec2,
     aws_rds as rds,
     aws_elasticache as elasticache,
-    Duration,
     aws_sns as sns,
+    Duration,
     RemovalPolicy,
-    CfnTag,
+    ArnFormat,
 )
 from constructs import Construct
-from ..config import get_database_config, get_project_name, get_alarm_config, get_cleanup_config
+from ..config import get_database_config, get_cleanup_config, AlarmConfig
 from ..utils.alarms import create_rds_alarms, create_redis_alarms
 
+# Keep a final snapshot of prod databases; everything else is torn down with the stack
+_REMOVAL_POLICY_BY_ENV = {"prod": RemovalPolicy.SNAPSHOT}
+
+# Enhanced Monitoring granularity for prod databases
+_MONITORING_INTERVAL = Duration.seconds(60)
+
+def _app_ingress(app_security_group: ec2.ISecurityGroup, port: int, description: str) -> ec2.CfnSecurityGroup.IngressProperty:
+    """Inline TCP ingress rule allowing traffic from the application security group"""
+    return ec2.CfnSecurityGroup.IngressProperty(
+        ip_protocol="tcp",
+        from_port=port,
+        to_port=port,
+        source_security_group_id=app_security_group.security_group_id,
+        description=description
+    )
+
 class DatabaseStack(Stack):
     def __init__(
         self, 
@@ -19,42 +35,57 @@ class DatabaseStack(Stack):
         construct_id: str, 
         env_name: str, 
         vpc: ec2.Vpc, 
-        app_security_group: ec2.SecurityGroup, 
+        app_security_group: ec2.ISecurityGroup, 
+        project_name: str,
+        alarm_config: AlarmConfig,
+        alarm_topic: sns.ITopic,
         **kwargs
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
-        project_name = get_project_name(scope)
         config = get_database_config(scope, env_name)
-        alarm_config = get_alarm_config(scope, env_name)
-        cleanup_config = get_cleanup_config(scope, env_name)  # Add this
+        cleanup_config = get_cleanup_config(scope, env_name)
+        cleanup_redis = cleanup_config.redis
+        cleanup_rds = cleanup_config.rds
+        backup_retention = Duration.days(cleanup_rds["backupRetentionDays"])
+        prefix = f"{project_name}-{env_name}-"  # Shared construct id/name prefix
+        is_prod = env_name == "prod"
 
         # Update RDS instance name
-        rds_name = f"{project_name}-{env_name}-postgres-db"
+        rds_name = prefix + "postgres-db"
         
         # Update Redis cluster name
-        redis_name = f"{project_name}-{env_name}-redis-cluster"
+        redis_name = prefix + "redis-cluster"
         
         # Update security group names
-        rds_sg_name = f"{project_name}-{env_name}-rds-sg"
-        redis_sg_name = f"{project_name}-{env_name}-redis-sg"
+        rds_sg_name = prefix + "rds-sg"
+        redis_sg_name = prefix + "redis-sg"
+
+        # Resolve the private subnets once for both Redis and RDS
+        private_subnets = vpc.select_subnets(subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS)
 
         # Create Redis Security Group
-        self.cache_security_group = ec2.SecurityGroup(
+        # Ingress is declared inline (L1) so the rule is part of the group itself
+        # instead of a separate AWS::EC2::SecurityGroupIngress resource
+        redis_sg = ec2.CfnSecurityGroup(
             self,
             redis_sg_name,
-            vpc=vpc,
-            description="Security Group for Redis Cluster",
-            allow_all_outbound=True
+            vpc_id=vpc.vpc_id,
+            group_description="Security Group for Redis Cluster",
+            security_group_ingress=[
+                # Allow application to connect to Redis
+                _app_ingress(app_security_group, config.redis.port, "Allow application to connect to Redis")
+            ]
+        )
+        self.cache_security_group = ec2.SecurityGroup.from_security_group_id(
+            self, redis_sg_name + "-ref", redis_sg.attr_group_id
         )
 
         # Create ElastiCache Subnet Group
         self.cache_subnet_group = elasticache.CfnSubnetGroup(
             self,
             f"{env_name}-Redis-SubnetGroup",
-            subnet_ids=vpc.select_subnets(
-                subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS
-            ).subnet_ids,
+            subnet_ids=private_subnets.subnet_ids,
             description="Subnet Group for Redis Cluster"
         )
 
@@ -69,32 +100,32 @@ class DatabaseStack(Stack):
             vpc_security_group_ids=[self.cache_security_group.security_group_id],
             cache_subnet_group_name=self.cache_subnet_group.ref,
             cluster_name=redis_name,
-            snapshot_retention_limit=cleanup_config.redis["snapshotRetentionDays"],
-            snapshot_window=cleanup_config.redis["snapshotWindow"],
-            preferred_maintenance_window=cleanup_config.redis["maintenanceWindow"],
-            auto_minor_version_upgrade=True,
-            tags=[
-                CfnTag(
-                    key="Environment",
-                    value=env_name
-                )
-            ]
+            snapshot_retention_limit=cleanup_redis["snapshotRetentionDays"],
+            snapshot_window=cleanup_redis["snapshotWindow"],
+            preferred_maintenance_window=cleanup_redis["maintenanceWindow"],
+            auto_minor_version_upgrade=True
         )
 
-        # Allow application to connect to Redis
-        self.cache_security_group.add_ingress_rule(
-            peer=ec2.Peer.security_group_id(app_security_group.security_group_id),
-            connection=ec2.Port.tcp(config.redis.port),
-            description="Allow application to connect to Redis"
+        self.redis_arn = self.format_arn(
+            service="elasticache",
+            resource="cluster",
+            resource_name=self.redis_cluster.ref,
+            arn_format=ArnFormat.COLON_RESOURCE_NAME
         )
 
         # Create RDS Security Group
-        self.rds_security_group = ec2.SecurityGroup(
+        rds_sg = ec2.CfnSecurityGroup(
             self,
             rds_sg_name,
-            vpc=vpc,
-            description="Security Group for RDS PostgreSQL",
-            allow_all_outbound=True
+            vpc_id=vpc.vpc_id,
+            group_description="Security Group for RDS PostgreSQL",
+            security_group_ingress=[
+                # Allow application to connect to PostgreSQL
+                _app_ingress(app_security_group, config.rds.port, "Allow application to connect to PostgreSQL")
+            ]
+        )
+        self.rds_security_group = ec2.SecurityGroup.from_security_group_id(
+            self, rds_sg_name + "-ref", rds_sg.attr_group_id
         )
 
         # Create RDS Parameter Group
@@ -117,16 +148,14 @@ class DatabaseStack(Stack):
             instance_type=ec2.InstanceType(config.rds.instance_type),
             allocated_storage=config.rds.allocated_storage,
             max_allocated_storage=config.rds.max_allocated_storage,
-            storage_type=rds.StorageType.GP2,
+            storage_type=rds.StorageType.GP3,
             vpc=vpc,
-            vpc_subnets=ec2.SubnetSelection(
-                subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS
-            ),
+            vpc_subnets=ec2.SubnetSelection(subnets=private_subnets.subnets),
             security_groups=[self.rds_security_group],
             multi_az=config.rds.multi_az,
-            backup_retention=Duration.days(cleanup_config.rds["backupRetentionDays"]),
+            backup_retention=backup_retention,
             preferred_backup_window="03:00-04:00",
-            preferred_maintenance_window=cleanup_config.rds["maintenanceWindow"],
+            preferred_maintenance_window=cleanup_rds["maintenanceWindow"],
             database_name=config.rds.database_name,
             port=config.rds.port,
             credentials=rds.Credentials.from_generated_secret(
@@ -135,31 +164,18 @@ class DatabaseStack(Stack):
             ),
             parameter_group=self.db_parameter_group,
             deletion_protection=config.rds.deletion_protection,
-            monitoring_interval=Duration.seconds(60),
-            enable_performance_insights=True,
-            performance_insights_retention=rds.PerformanceInsightRetention.DEFAULT,
+            # Enhanced Monitoring (and its IAM role) and Performance Insights
+            # are only worth paying for in prod
+            monitoring_interval=_MONITORING_INTERVAL if is_prod else None,
+            enable_performance_insights=is_prod,
+            # Retention may only be set when Performance Insights is enabled
+            performance_insights_retention=rds.PerformanceInsightRetention.DEFAULT if is_prod else None,
             instance_identifier=rds_name,
-            delete_automated_backups=cleanup_config.rds["deleteAutomatedBackups"],
-            removal_policy=RemovalPolicy.SNAPSHOT if env_name == "prod" else RemovalPolicy.DESTROY,
-            performance_insights_retention=rds.PerformanceInsightRetention.DEFAULT,
-            allocated_storage=20,
-            max_allocated_storage=100,
-            storage_type=rds.StorageType.GP3
+            delete_automated_backups=cleanup_rds["deleteAutomatedBackups"],
+            removal_policy=_REMOVAL_POLICY_BY_ENV.get(env_name, RemovalPolicy.DESTROY)
         )
 
-        # Allow application to connect to PostgreSQL
-        self.rds_security_group.add_ingress_rule(
-            peer=ec2.Peer.security_group_id(app_security_group.security_group_id),
-            connection=ec2.Port.tcp(config.rds.port),
-            description="Allow application to connect to PostgreSQL"
-        ) 
-
-        # Get the alarm topic
-        alarm_topic = sns.Topic.from_topic_arn(
-            self,
-            f"{project_name}-{env_name}-alarm-topic",
-            f"arn:aws:sns:{self.region}:{self.account}:{project_name}-{env_name}-alarms"
-        )
+        self.rds_arn = self.rds_instance.instance_arn
 
         # Create RDS alarms
         create_rds_alarms(
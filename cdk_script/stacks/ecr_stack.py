@@ -8,13 +8,16 @@ from aws_cdk import (
 from constructs import Construct
 from ..config import (
     get_ecr_config, 
-    get_project_name,
     get_cleanup_config,
-    get_env_config  # Add this import
 )
 
-project_name = get_project_name()
-env_name = get_env_config()
+# Lifecycle rule specs: (description, tag status, match tag prefixes, expire by age).
+# ECR requires the TagStatus.ANY rule to carry the highest priority, so it goes last.
+_ECR_RULE_SPECS = (
+    ("Remove untagged images", ecr.TagStatus.UNTAGGED, False, True),
+    ("Clean up by tag prefixes", ecr.TagStatus.TAGGED, True, False),
+    ("Keep only recent images", ecr.TagStatus.ANY, False, False),
+)
 
 class ECRStack(Stack):
     """
@@ -28,6 +31,10 @@ class ECRStack(Stack):
         # Get configuration from context
         config = get_ecr_config(scope, env_name)
         cleanup_config = get_cleanup_config(scope, env_name)
+        cleanup_ecr = cleanup_config.ecr
+        max_tagged_images = cleanup_ecr["maxTaggedImages"]
+        untagged_retention = Duration.days(cleanup_ecr["untaggedRetentionDays"])
+        tag_prefixes = cleanup_ecr["tagPrefixes"]
 
         # Create the ECR Repository with enhanced lifecycle rules
         self.repository = ecr.Repository(
@@ -37,67 +44,18 @@ class ECRStack(Stack):
             removal_policy=RemovalPolicy.DESTROY,
             image_scan_on_push=config.enable_scan,
             image_tag_mutability=ecr.TagMutability.MUTABLE,
+            # Built from _ECR_RULE_SPECS; priorities follow table order
             lifecycle_rules=[
-                # Rule for tagged images
-                ecr.LifecycleRule(
-                    description="Keep only recent tagged images",
-                    max_image_count=cleanup_config.ecr["maxTaggedImages"],
-                    rule_priority=1,
-                    selection_criteria=[ecr.TagStatus.TAGGED]
-                ),
-                # Rule for untagged images
-                ecr.LifecycleRule(
-                    description="Remove untagged images",
-                    max_image_age=Duration.days(cleanup_config.ecr["untaggedRetentionDays"]),
-                    rule_priority=2,
-                    selection_criteria=[ecr.TagStatus.UNTAGGED]
-                ),
-                # Rule for specific tag prefixes
                 ecr.LifecycleRule(
-                    description="Clean up by tag prefixes",
-                    max_image_count=cleanup_config.ecr["maxTaggedImages"],
-                    rule_priority=3,
-                    tag_prefix_list=cleanup_config.ecr["tagPrefixes"]
+                    description=description,
+                    rule_priority=priority,
+                    tag_status=tag_status,
+                    tag_prefix_list=tag_prefixes if by_prefix else None,
+                    max_image_age=untagged_retention if by_age else None,
+                    max_image_count=None if by_age else max_tagged_images
                 )
+                for priority, (description, tag_status, by_prefix, by_age)
+                in enumerate(_ECR_RULE_SPECS, start=1)
             ],
             auto_delete_images=True
         )
-
-    def create_repository(self):
-        # Get cleanup configuration
-        cleanup_config = get_cleanup_config(self, env_name)
-        
-        ecr.Repository(
-            self,
-            f"{project_name}-{env_name}-repo",
-            repository_name=f"{project_name}-{env_name}",
-            removal_policy=RemovalPolicy.DESTROY if env_name == "dev" else RemovalPolicy.RETAIN,
-            lifecycle_rules=[
-                # Rule for tagged images
-                ecr.LifecycleRule(
-                    description="Keep only recent tagged images",
-                    max_image_count=cleanup_config.ecr["maxTaggedImages"],
-                    rule_priority=1,
-                    selection_criteria=[
-                        ecr.TagStatus.TAGGED
-                    ]
-                ),
-                # Rule for untagged images
-                ecr.LifecycleRule(
-                    description="Remove untagged images",
-                    max_image_age=Duration.days(cleanup_config.ecr["untaggedRetentionDays"]),
-                    rule_priority=2,
-                    selection_criteria=[
-                        ecr.TagStatus.UNTAGGED
-                    ]
-                ),
-                # Rule for specific tag prefixes
-                ecr.LifecycleRule(
-                    description="Clean up by tag prefixes",
-                    max_image_count=cleanup_config.ecr["maxTaggedImages"],
-                    rule_priority=3,
-                    tag_prefix_list=cleanup_config.ecr["tagPrefixes"]
-                )
-            ],
-            image_scan_on_push=True
-        )
\ No newline at end of file
@@ -1,14 +1,35 @@
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence, Union
+
 from aws_cdk import (
     aws_cloudwatch as cloudwatch,
     aws_cloudwatch_actions as cloudwatch_actions,
+    aws_ec2 as ec2,
+    aws_ecs_patterns as ecs_patterns,
+    aws_elasticache as elasticache,
+    aws_rds as rds,
     aws_sns as sns,
     Duration,
 )
+from constructs import Construct
+from ..config import AlarmConfig
+
+# Metric periods shared by every alarm (Duration is immutable, so one instance each)
+_ONE_MINUTE = Duration.minutes(1)
+_FIVE_MINUTES = Duration.minutes(5)
+_ONE_DAY = Duration.hours(24)
+
+# Comparison operators used by the alarm specs
+_GT = cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD
+_LT = cloudwatch.ComparisonOperator.LESS_THAN_THRESHOLD
 
-def create_alarm_topic(scope, project_name: str, env_name: str) -> sns.Topic:
+def create_alarm_topic(scope: Construct, project_name: str, env_name: str) -> sns.Topic:
     """
     Creates an SNS topic for all infrastructure alarms.
     
+    Call this from a stack that deploys before every stack alarming on the
+    topic, and pass the returned topic to those stacks.
+    
     Args:
         scope: The CDK scope to create the topic in
         project_name: The name of the project
@@ -24,47 +45,343 @@ def create_alarm_topic(scope, project_name: str, env_name: str) -> sns.Topic:
         display_name=f"{project_name} {env_name} Alarms"
     )
 
-def create_cost_alarms(scope, project_name: str, env_name: str, alarm_config: dict, alarm_topic: sns.Topic):
+@dataclass(frozen=True, slots=True)
+class AlarmSpec:
     """
-    Creates AWS Cost Explorer alarms for monitoring infrastructure costs.
+    Describes one CloudWatch alarm created by _build_alarms.
+    
+    The description is a format string; {threshold} is filled in with the
+    resolved threshold when the alarm is built.
+    """
+    suffix: str
+    metric: Callable[[Any], cloudwatch.IMetric]
+    threshold: Union[float, Callable[[AlarmConfig], float]]
+    description: str
+    evaluation_periods: int = 3
+    datapoints_to_alarm: Optional[int] = 2
+    comparison_operator: cloudwatch.ComparisonOperator = _GT
+
+def _build_alarms(scope: Construct, project_name: str, env_name: str, specs: Sequence[AlarmSpec], resource: Any, alarm_config: AlarmConfig) -> List[cloudwatch.Alarm]:
+    """
+    Creates the alarms described by specs, without any alarm actions.
     
     Args:
         scope: The CDK scope to create the alarms in
         project_name: The name of the project
         env_name: The environment name
-        alarm_config: Configuration for the alarms
+        specs: The alarms to create
+        resource: The monitored resource, passed to each spec's metric factory
+        alarm_config: Configuration for the alarms, passed to callable thresholds
+    
+    Returns:
+        List[cloudwatch.Alarm]: The created alarms, in spec order
+    """
+    prefix = f"{project_name}-{env_name}-"
+    alarms: List[cloudwatch.Alarm] = []
+    for spec in specs:
+        threshold = spec.threshold(alarm_config) if callable(spec.threshold) else spec.threshold
+        alarms.append(cloudwatch.Alarm(
+            scope,
+            prefix + spec.suffix,
+            metric=spec.metric(resource),
+            threshold=threshold,
+            evaluation_periods=spec.evaluation_periods,
+            datapoints_to_alarm=spec.datapoints_to_alarm,
+            comparison_operator=spec.comparison_operator,
+            alarm_description=spec.description.format(threshold=threshold)
+        ))
+    return alarms
+
+def _add_composite_alarm(scope: Construct, project_name: str, env_name: str, subsystem: str, alarms: Sequence[cloudwatch.IAlarm], alarm_topic: sns.ITopic) -> cloudwatch.CompositeAlarm:
+    """
+    Notifies the alarm topic when any of a subsystem's alarms fires.
+    
+    The leaf alarms stay silent; only the composite publishes to SNS, so a
+    correlated incident sends one notification instead of one per alarm.
+    
+    Args:
+        scope: The CDK scope to create the composite alarm in
+        project_name: The name of the project
+        env_name: The environment name
+        subsystem: Short name used in the alarm id and description (rds, redis, ...)
+        alarms: The subsystem's leaf alarms
         alarm_topic: SNS topic to send alarm notifications to
+    
+    Returns:
+        cloudwatch.CompositeAlarm: The composite alarm
     """
-    # Daily cost alarm
-    daily_cost_metric = cloudwatch.Metric(
-        namespace="AWS/Billing",
-        metric_name="EstimatedCharges",
-        statistic="Maximum",
-        period=Duration.hours(24),
-        dimensions={"Currency": "USD"}
+    composite_alarm = cloudwatch.CompositeAlarm(
+        scope,
+        f"{project_name}-{env_name}-{subsystem}-composite-alarm",
+        alarm_rule=cloudwatch.AlarmRule.any_of(*alarms),
+        alarm_description=f"One or more {subsystem} alarms are in ALARM state"
     )
+    composite_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
+    return composite_alarm
 
-    daily_cost_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-daily-cost-alarm",
-        metric=daily_cost_metric,
-        threshold=alarm_config.costs["dailyThreshold"],
+_COST_ALARM_SPECS = (
+    # Daily cost alarm
+    AlarmSpec(
+        "daily-cost-alarm",
+        lambda _: cloudwatch.Metric(
+            namespace="AWS/Billing",
+            metric_name="EstimatedCharges",
+            statistic="Maximum",
+            period=_ONE_DAY,
+            dimensions_map={"Currency": "USD"}
+        ),
+        lambda cfg: cfg.costs["dailyThreshold"],
+        "Daily cost exceeded ${threshold} USD",
+        evaluation_periods=1,
+        datapoints_to_alarm=None
+    ),
+)
+
+_RDS_ALARM_SPECS = (
+    # CPU Utilization Alarm
+    AlarmSpec(
+        "rds-cpu-alarm",
+        lambda rds_instance: rds_instance.metric_cpu_utilization(),
+        lambda cfg: cfg.rds["cpuThreshold"],
+        "RDS CPU utilization exceeded {threshold}%"
+    ),
+    # Free Storage Space Alarm
+    AlarmSpec(
+        "rds-storage-alarm",
+        lambda rds_instance: rds_instance.metric_free_storage_space(),
+        lambda cfg: cfg.rds["storageThreshold"],
+        "RDS free storage space below {threshold} bytes",
+        comparison_operator=_LT
+    ),
+    # Connection Count Alarm
+    AlarmSpec(
+        "rds-connection-alarm",
+        lambda rds_instance: rds_instance.metric_database_connections(),
+        lambda cfg: cfg.rds["connectionThreshold"],
+        "RDS connections near limit: {threshold}",
+        evaluation_periods=2
+    ),
+    # Deadlock Alarm
+    AlarmSpec(
+        "rds-deadlock-alarm",
+        lambda rds_instance: cloudwatch.Metric(
+            namespace="AWS/RDS",
+            metric_name="Deadlocks",
+            dimensions_map={"DBInstanceIdentifier": rds_instance.instance_identifier},
+            statistic="Sum",
+            period=_FIVE_MINUTES
+        ),
+        0,
+        "RDS Deadlock detected",
+        evaluation_periods=1,
+        datapoints_to_alarm=None
+    ),
+)
+
+_REDIS_ALARM_SPECS = (
+    # CPU Utilization Alarm
+    AlarmSpec(
+        "redis-cpu-alarm",
+        lambda redis_cluster: cloudwatch.Metric(
+            namespace="AWS/ElastiCache",
+            metric_name="CPUUtilization",
+            dimensions_map={"CacheClusterId": redis_cluster.ref},
+            statistic="Average",
+            period=_FIVE_MINUTES
+        ),
+        lambda cfg: cfg.redis["cpuThreshold"],
+        "Redis CPU utilization exceeded {threshold}%"
+    ),
+    # Eviction Alarm
+    AlarmSpec(
+        "redis-eviction-alarm",
+        lambda redis_cluster: cloudwatch.Metric(
+            namespace="AWS/ElastiCache",
+            metric_name="Evictions",
+            dimensions_map={"CacheClusterId": redis_cluster.ref},
+            statistic="Sum",
+            period=_FIVE_MINUTES
+        ),
+        lambda cfg: cfg.redis["evictionThreshold"],
+        "Redis evictions occurring",
+        evaluation_periods=1,
+        datapoints_to_alarm=None
+    ),
+)
+
+# Built from the cluster's average memory metric, passed in by create_redis_alarms
+_REDIS_MEMORY_ALARM_SPECS = (
+    # Memory Usage Alarm
+    AlarmSpec(
+        "redis-memory-alarm",
+        lambda memory_metric: memory_metric,
+        lambda cfg: cfg.redis["memoryThreshold"],
+        "Redis memory usage exceeded {threshold}%"
+    ),
+    # Critical Memory Usage Alarm (same metric, sampled at its peak every minute)
+    AlarmSpec(
+        "redis-critical-memory-alarm",
+        lambda memory_metric: memory_metric.with_(statistic="Maximum", period=_ONE_MINUTE),
+        90,
+        "Redis memory usage critically high (>90%)",
         evaluation_periods=1,
-        comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-        alarm_description=f"Daily cost exceeded ${alarm_config.costs['dailyThreshold']} USD"
+        datapoints_to_alarm=None
+    ),
+)
+
+_ECS_ALARM_SPECS = (
+    # CPU Utilization Alarm
+    AlarmSpec(
+        "ecs-cpu-alarm",
+        lambda fargate_service: fargate_service.service.metric_cpu_utilization(),
+        lambda cfg: cfg.ecs["cpuThreshold"],
+        "ECS CPU utilization exceeded {threshold}%"
+    ),
+    # Memory Utilization Alarm
+    AlarmSpec(
+        "ecs-memory-alarm",
+        lambda fargate_service: fargate_service.service.metric_memory_utilization(),
+        lambda cfg: cfg.ecs["memoryThreshold"],
+        "ECS memory utilization exceeded {threshold}%"
+    ),
+    # HTTP 5XX Error Alarm
+    AlarmSpec(
+        "ecs-5xx-alarm",
+        lambda fargate_service: fargate_service.load_balancer.metric_http_code_target(
+            code="5XX",
+            period=_FIVE_MINUTES
+        ),
+        lambda cfg: cfg.ecs["error5xxThreshold"],
+        "HTTP 5XX errors exceeded {threshold} per 5 minutes"
+    ),
+    # Service Health Check Alarm
+    AlarmSpec(
+        "ecs-health-alarm",
+        lambda fargate_service: fargate_service.target_group.metric_unhealthy_host_count(
+            period=_ONE_MINUTE
+        ),
+        lambda cfg: cfg.ecs["unhealthyTaskThreshold"],
+        "ECS tasks failing health checks",
+        evaluation_periods=2
+    ),
+    # Running Tasks Alarm (below minimum)
+    AlarmSpec(
+        "ecs-min-tasks-alarm",
+        lambda fargate_service: fargate_service.service.metric_running_task_count(),
+        lambda cfg: cfg.ecs["minTasks"],
+        "Running tasks below minimum threshold: {threshold}",
+        evaluation_periods=2,
+        comparison_operator=_LT
+    ),
+    # Container Fatal Error Alarm
+    AlarmSpec(
+        "ecs-container-error-alarm",
+        lambda fargate_service: cloudwatch.Metric(
+            namespace="AWS/ECS",
+            metric_name="ContainerExitCode",
+            dimensions_map={
+                "ClusterName": fargate_service.cluster.cluster_name,
+                "ServiceName": fargate_service.service.service_name
+            },
+            statistic="Maximum",
+            period=_ONE_MINUTE
+        ),
+        0,
+        "Container exited with error",
+        evaluation_periods=1,
+        datapoints_to_alarm=None
+    ),
+)
+
+def _nat_gateway_expression(nat_gateway_ids: Sequence[str], metric_name: str, statistic: str, function: str) -> cloudwatch.MathExpression:
+    """
+    Aggregates one NAT Gateway metric across every gateway into a single series.
+    
+    Args:
+        nat_gateway_ids: IDs of the NAT Gateways to aggregate
+        metric_name: The AWS/NATGateway metric to read
+        statistic: Statistic applied to each gateway's metric
+        function: Metric math function over the per-gateway series (SUM, MAX, ...)
+    
+    Returns:
+        cloudwatch.MathExpression: The aggregated metric
+    """
+    using_metrics = {
+        f"m{index}": cloudwatch.Metric(
+            namespace="AWS/NATGateway",
+            metric_name=metric_name,
+            dimensions_map={"NatGatewayId": nat_gateway_id},
+            statistic=statistic,
+            period=_FIVE_MINUTES
+        )
+        for index, nat_gateway_id in enumerate(nat_gateway_ids)
+    }
+    return cloudwatch.MathExpression(
+        expression=f"{function}([{', '.join(using_metrics)}])",
+        using_metrics=using_metrics,
+        period=_FIVE_MINUTES
     )
-    daily_cost_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
 
-def create_rds_alarms(scope, project_name: str, env_name: str, alarm_config: dict, rds_instance, alarm_topic: sns.Topic):
+# Built from the IDs of all NAT Gateways in the VPC, one alarm each across every AZ
+_NAT_GATEWAY_ALARM_SPECS = (
+    # Port Allocation Alarm (busiest gateway)
+    AlarmSpec(
+        "nat-port-alarm",
+        lambda nat_gateway_ids: _nat_gateway_expression(nat_gateway_ids, "PortAllocation", "Average", "MAX"),
+        lambda cfg: cfg.network["natPortThreshold"],
+        "NAT Gateway port allocation exceeded {threshold}"
+    ),
+    # Error Count Alarm (total over all gateways)
+    AlarmSpec(
+        "nat-error-alarm",
+        lambda nat_gateway_ids: _nat_gateway_expression(nat_gateway_ids, "ErrorPortAllocation", "Sum", "SUM"),
+        lambda cfg: cfg.network["natErrorThreshold"],
+        "NAT Gateway error count exceeded {threshold}"
+    ),
+)
+
+_NETWORK_ALARM_SPECS = (
+    # Network Changes Alarm using CloudTrail
+    AlarmSpec(
+        "network-changes-alarm",
+        lambda _: cloudwatch.Metric(
+            namespace="AWS/CloudTrail",
+            metric_name="SecurityGroupEventCount",
+            statistic="Sum",
+            period=_FIVE_MINUTES
+        ),
+        0,
+        "Security Group or NACL changes detected",
+        evaluation_periods=1,
+        datapoints_to_alarm=None
+    ),
+)
+
+def create_cost_alarms(scope: Construct, project_name: str, env_name: str, alarm_config: AlarmConfig, alarm_topic: sns.ITopic) -> None:
+    """
+    Creates AWS Cost Explorer alarms for monitoring infrastructure costs.
+    
+    Args:
+        scope: The CDK scope to create the alarms in
+        project_name: The name of the project
+        env_name: The environment name
+        alarm_config: Configuration for the alarms
+        alarm_topic: SNS topic to send alarm notifications to
+    """
+    # A single alarm, so it notifies the topic directly
+    sns_action = cloudwatch_actions.SnsAction(alarm_topic)
+    for alarm in _build_alarms(scope, project_name, env_name, _COST_ALARM_SPECS, None, alarm_config):
+        alarm.add_alarm_action(sns_action)
+
+def create_rds_alarms(scope: Construct, project_name: str, env_name: str, alarm_config: AlarmConfig, rds_instance: rds.IDatabaseInstance, alarm_topic: sns.ITopic) -> None:
     """
     Creates CloudWatch alarms for RDS monitoring.
     
     Monitors:
     - CPU Utilization
     - Free Storage Space
-    - Free Memory
     - Connection Count
-    - Read/Write Latency
+    - Deadlocks
     
     Args:
         scope: The CDK scope to create the alarms in
@@ -74,76 +391,17 @@ def create_rds_alarms(scope, project_name: str, env_name: str, alarm_config: dic
         rds_instance: The RDS instance to monitor
         alarm_topic: SNS topic to send alarm notifications to
     """
-    # CPU Utilization Alarm
-    cpu_metric = rds_instance.metric_cpu_utilization()
-    cpu_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-rds-cpu-alarm",
-        metric=cpu_metric,
-        threshold=alarm_config.rds["cpuThreshold"],
-        evaluation_periods=3,
-        datapoints_to_alarm=2,
-        comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-        alarm_description=f"RDS CPU utilization exceeded {alarm_config.rds['cpuThreshold']}%"
-    )
-    cpu_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
-
-    # Free Storage Space Alarm
-    storage_metric = rds_instance.metric_free_storage_space()
-    storage_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-rds-storage-alarm",
-        metric=storage_metric,
-        threshold=alarm_config.rds["storageThreshold"],
-        evaluation_periods=3,
-        datapoints_to_alarm=2,
-        comparison_operator=cloudwatch.ComparisonOperator.LESS_THAN_THRESHOLD,
-        alarm_description=f"RDS free storage space below {alarm_config.rds['storageThreshold']} bytes"
-    )
-    storage_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
-
-    # Add Connection Count Alarm
-    connection_metric = rds_instance.metric_database_connections()
-    connection_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-rds-connection-alarm",
-        metric=connection_metric,
-        threshold=alarm_config.rds["connectionThreshold"],
-        evaluation_periods=2,
-        datapoints_to_alarm=2,
-        comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-        alarm_description=f"RDS connections near limit: {alarm_config.rds['connectionThreshold']}"
-    )
-    connection_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
+    alarms = _build_alarms(scope, project_name, env_name, _RDS_ALARM_SPECS, rds_instance, alarm_config)
+    _add_composite_alarm(scope, project_name, env_name, "rds", alarms, alarm_topic)
 
-    # Add Deadlock Alarm
-    deadlock_metric = cloudwatch.Metric(
-        namespace="AWS/RDS",
-        metric_name="Deadlocks",
-        dimensions={"DBInstanceIdentifier": rds_instance.instance_identifier},
-        statistic="Sum",
-        period=Duration.minutes(5)
-    )
-    deadlock_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-rds-deadlock-alarm",
-        metric=deadlock_metric,
-        threshold=0,
-        evaluation_periods=1,
-        comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-        alarm_description="RDS Deadlock detected"
-    )
-    deadlock_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
-
-def create_redis_alarms(scope, project_name: str, env_name: str, alarm_config: dict, redis_cluster, alarm_topic: sns.Topic):
+def create_redis_alarms(scope: Construct, project_name: str, env_name: str, alarm_config: AlarmConfig, redis_cluster: elasticache.CfnCacheCluster, alarm_topic: sns.ITopic) -> None:
     """
     Creates CloudWatch alarms for Redis monitoring.
     
     Monitors:
     - CPU Utilization
     - Memory Usage
-    - Connection Count
-    - Cache Hit Rate
+    - Critical Memory Usage
     - Evictions
     
     Args:
@@ -154,92 +412,29 @@ def create_redis_alarms(scope, project_name: str, env_name: str, alarm_config: d
         redis_cluster: The Redis cluster to monitor
         alarm_topic: SNS topic to send alarm notifications to
     """
-    # CPU Utilization Alarm
-    cpu_metric = cloudwatch.Metric(
-        namespace="AWS/ElastiCache",
-        metric_name="CPUUtilization",
-        dimensions={"CacheClusterId": redis_cluster.ref},
-        statistic="Average",
-        period=Duration.minutes(5)
-    )
-    cpu_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-redis-cpu-alarm",
-        metric=cpu_metric,
-        threshold=alarm_config.redis["cpuThreshold"],
-        evaluation_periods=3,
-        datapoints_to_alarm=2,
-        comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-        alarm_description=f"Redis CPU utilization exceeded {alarm_config.redis['cpuThreshold']}%"
-    )
-    cpu_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
+    alarms = _build_alarms(scope, project_name, env_name, _REDIS_ALARM_SPECS, redis_cluster, alarm_config)
 
-    # Memory Usage Alarm
     memory_metric = cloudwatch.Metric(
         namespace="AWS/ElastiCache",
         metric_name="DatabaseMemoryUsagePercentage",
-        dimensions={"CacheClusterId": redis_cluster.ref},
+        dimensions_map={"CacheClusterId": redis_cluster.ref},
         statistic="Average",
-        period=Duration.minutes(5)
-    )
-    memory_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-redis-memory-alarm",
-        metric=memory_metric,
-        threshold=alarm_config.redis["memoryThreshold"],
-        evaluation_periods=3,
-        datapoints_to_alarm=2,
-        comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-        alarm_description=f"Redis memory usage exceeded {alarm_config.redis['memoryThreshold']}%"
-    )
-    memory_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
-
-    # Add Critical Memory Usage Alarm
-    critical_memory_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-redis-critical-memory-alarm",
-        metric=cloudwatch.Metric(
-            namespace="AWS/ElastiCache",
-            metric_name="DatabaseMemoryUsagePercentage",
-            dimensions={"CacheClusterId": redis_cluster.ref},
-            statistic="Maximum",
-            period=Duration.minutes(1)
-        ),
-        threshold=90,
-        evaluation_periods=1,
-        comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-        alarm_description="Redis memory usage critically high (>90%)"
-    )
-    critical_memory_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
-
-    # Add Eviction Alarm
-    eviction_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-redis-eviction-alarm",
-        metric=cloudwatch.Metric(
-            namespace="AWS/ElastiCache",
-            metric_name="Evictions",
-            dimensions={"CacheClusterId": redis_cluster.ref},
-            statistic="Sum",
-            period=Duration.minutes(5)
-        ),
-        threshold=alarm_config.redis.get("evictionThreshold", 1000),
-        evaluation_periods=1,
-        comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-        alarm_description="Redis evictions occurring"
+        period=_FIVE_MINUTES
     )
-    eviction_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
+    alarms += _build_alarms(scope, project_name, env_name, _REDIS_MEMORY_ALARM_SPECS, memory_metric, alarm_config)
+    _add_composite_alarm(scope, project_name, env_name, "redis", alarms, alarm_topic)
 
-def create_ecs_alarms(scope, project_name: str, env_name: str, alarm_config: dict, fargate_service, alarm_topic: sns.Topic):
+def create_ecs_alarms(scope: Construct, project_name: str, env_name: str, alarm_config: AlarmConfig, fargate_service: ecs_patterns.ApplicationLoadBalancedFargateService, alarm_topic: sns.ITopic) -> None:
     """
     Creates CloudWatch alarms for ECS/Fargate monitoring.
     
     Monitors:
     - CPU Utilization
     - Memory Utilization
-    - Running Task Count
-    - Target Response Time
     - HTTP 5XX Errors
+    - Unhealthy Targets
+    - Running Task Count
+    - Container Exit Codes
     
     Args:
         scope: The CDK scope to create the alarms in
@@ -249,112 +444,17 @@ def create_ecs_alarms(scope, project_name: str, env_name: str, alarm_config: dic
         fargate_service: The Fargate service to monitor
         alarm_topic: SNS topic to send alarm notifications to
     """
-    # CPU Utilization Alarm
-    cpu_metric = fargate_service.service.metric_cpu_utilization()
-    cpu_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-ecs-cpu-alarm",
-        metric=cpu_metric,
-        threshold=alarm_config.ecs["cpuThreshold"],
-        evaluation_periods=3,
-        datapoints_to_alarm=2,
-        comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-        alarm_description=f"ECS CPU utilization exceeded {alarm_config.ecs['cpuThreshold']}%"
-    )
-    cpu_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
-
-    # Memory Utilization Alarm
-    memory_metric = fargate_service.service.metric_memory_utilization()
-    memory_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-ecs-memory-alarm",
-        metric=memory_metric,
-        threshold=alarm_config.ecs["memoryThreshold"],
-        evaluation_periods=3,
-        datapoints_to_alarm=2,
-        comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-        alarm_description=f"ECS memory utilization exceeded {alarm_config.ecs['memoryThreshold']}%"
-    )
-    memory_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
-
-    # HTTP 5XX Error Alarm
-    http_5xx_metric = fargate_service.load_balancer.metric_http_code_target(
-        code="5XX",
-        period=Duration.minutes(5)
-    )
-    http_5xx_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-ecs-5xx-alarm",
-        metric=http_5xx_metric,
-        threshold=alarm_config.ecs["error5xxThreshold"],
-        evaluation_periods=3,
-        datapoints_to_alarm=2,
-        comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-        alarm_description=f"HTTP 5XX errors exceeded {alarm_config.ecs['error5xxThreshold']} per 5 minutes"
-    )
-    http_5xx_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
+    alarms = _build_alarms(scope, project_name, env_name, _ECS_ALARM_SPECS, fargate_service, alarm_config)
+    _add_composite_alarm(scope, project_name, env_name, "ecs", alarms, alarm_topic)
 
-    # Add Service Health Check Alarm
-    health_check_metric = fargate_service.target_group.metric_unhealthy_host_count(
-        period=Duration.minutes(1)
-    )
-    health_check_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-ecs-health-alarm",
-        metric=health_check_metric,
-        threshold=alarm_config.ecs.get("unhealthyTaskThreshold", 1),
-        evaluation_periods=2,
-        datapoints_to_alarm=2,
-        comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-        alarm_description="ECS tasks failing health checks"
-    )
-    health_check_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
-
-    # Add Running Tasks Alarm (below minimum)
-    running_tasks_metric = fargate_service.service.metric_running_task_count()
-    min_tasks_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-ecs-min-tasks-alarm",
-        metric=running_tasks_metric,
-        threshold=alarm_config.ecs["minTasks"],
-        evaluation_periods=2,
-        datapoints_to_alarm=2,
-        comparison_operator=cloudwatch.ComparisonOperator.LESS_THAN_THRESHOLD,
-        alarm_description=f"Running tasks below minimum threshold: {alarm_config.ecs['minTasks']}"
-    )
-    min_tasks_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
-
-    # Add Container Fatal Error Alarm
-    container_error_metric = cloudwatch.Metric(
-        namespace="AWS/ECS",
-        metric_name="ContainerExitCode",
-        dimensions={
-            "ClusterName": fargate_service.cluster.cluster_name,
-            "ServiceName": fargate_service.service.service_name
-        },
-        statistic="Maximum",
-        period=Duration.minutes(1)
-    )
-    container_error_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-ecs-container-error-alarm",
-        metric=container_error_metric,
-        threshold=0,
-        evaluation_periods=1,
-        comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-        alarm_description="Container exited with error"
-    )
-    container_error_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
-
-def create_nat_gateway_alarms(scope, project_name: str, env_name: str, alarm_config: dict, vpc, alarm_topic: sns.Topic):
+def create_nat_gateway_alarms(scope: Construct, project_name: str, env_name: str, alarm_config: AlarmConfig, vpc: ec2.IVpc, alarm_topic: sns.ITopic) -> None:
     """
     Creates CloudWatch alarms for NAT Gateway monitoring.
     
     Monitors:
     - Port Allocation
-    - Packet Drop Count
     - Error Port Allocation
-    - Bytes Transfer
+    - Security Group / NACL changes
     
     Args:
         scope: The CDK scope to create the alarms in
@@ -364,82 +464,16 @@ def create_nat_gateway_alarms(scope, project_name: str, env_name: str, alarm_con
         vpc: The VPC containing NAT Gateways
         alarm_topic: SNS topic to send alarm notifications to
     """
-    for az_number, nat_gateway in enumerate(vpc.nat_gateways):
-        # Port Allocation Alarm
-        port_metric = cloudwatch.Metric(
-            namespace="AWS/NATGateway",
-            metric_name="PortAllocation",
-            dimensions={"NatGatewayId": nat_gateway.nat_gateway_id},
-            statistic="Average",
-            period=Duration.minutes(5)
-        )
-        port_alarm = cloudwatch.Alarm(
-            scope,
-            f"{project_name}-{env_name}-nat-port-alarm-{az_number}",
-            metric=port_metric,
-            threshold=alarm_config.network["natPortThreshold"],
-            evaluation_periods=3,
-            datapoints_to_alarm=2,
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-            alarm_description=f"NAT Gateway port allocation exceeded {alarm_config.network['natPortThreshold']}"
-        )
-        port_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
-
-        # Error Count Alarm
-        error_metric = cloudwatch.Metric(
-            namespace="AWS/NATGateway",
-            metric_name="ErrorPortAllocation",
-            dimensions={"NatGatewayId": nat_gateway.nat_gateway_id},
-            statistic="Sum",
-            period=Duration.minutes(5)
-        )
-        error_alarm = cloudwatch.Alarm(
-            scope,
-            f"{project_name}-{env_name}-nat-error-alarm-{az_number}",
-            metric=error_metric,
-            threshold=alarm_config.network["natErrorThreshold"],
-            evaluation_periods=3,
-            datapoints_to_alarm=2,
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-            alarm_description=f"NAT Gateway error count exceeded {alarm_config.network['natErrorThreshold']}"
-        )
-        error_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic)) 
+    # The VPC creates each NAT Gateway as a "NATGateway" child of a public subnet;
+    # an imported VPC has none, so only the network changes alarm is created
+    nat_gateway_ids = [
+        nat_gateway.attr_nat_gateway_id
+        for nat_gateway in (subnet.node.try_find_child("NATGateway") for subnet in vpc.public_subnets)
+        if nat_gateway is not None
+    ]
 
-    # Add NAT Gateway Error Alarm
-    for az_index, nat_gateway in enumerate(vpc.nat_gateways):
-        error_metric = cloudwatch.Metric(
-            namespace="AWS/NATGateway",
-            metric_name="ErrorPortAllocation",
-            dimensions={"NatGatewayId": nat_gateway.nat_gateway_id},
-            statistic="Sum",
-            period=Duration.minutes(5)
-        )
-        error_alarm = cloudwatch.Alarm(
-            scope,
-            f"{project_name}-{env_name}-nat-error-az{az_index}-alarm",
-            metric=error_metric,
-            threshold=alarm_config.network.get("natErrorThreshold", 5),
-            evaluation_periods=2,
-            datapoints_to_alarm=2,
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-            alarm_description=f"NAT Gateway in AZ {az_index} experiencing port allocation errors"
-        )
-        error_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
-
-    # Add Network Changes Alarm using CloudTrail
-    network_changes_metric = cloudwatch.Metric(
-        namespace="AWS/CloudTrail",
-        metric_name="SecurityGroupEventCount",
-        statistic="Sum",
-        period=Duration.minutes(5)
-    )
-    network_changes_alarm = cloudwatch.Alarm(
-        scope,
-        f"{project_name}-{env_name}-network-changes-alarm",
-        metric=network_changes_metric,
-        threshold=0,
-        evaluation_periods=1,
-        comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-        alarm_description="Security Group or NACL changes detected"
-    )
-    network_changes_alarm.add_alarm_action(cloudwatch_actions.SnsAction(alarm_topic))
\ No newline at end of file
+    alarms: List[cloudwatch.Alarm] = []
+    if nat_gateway_ids:
+        alarms += _build_alarms(scope, project_name, env_name, _NAT_GATEWAY_ALARM_SPECS, nat_gateway_ids, alarm_config)
+    alarms += _build_alarms(scope, project_name, env_name, _NETWORK_ALARM_SPECS, None, alarm_config)
+    _add_composite_alarm(scope, project_name, env_name, "network", alarms, alarm_topic)
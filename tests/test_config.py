@@ -0,0 +1,99 @@
+import pytest
+
+pytest.importorskip("constructs")
+
+from cdk_script import config
+from cdk_script.config import (
+    clear_config_cache,
+    get_env_config,
+    get_network_config,
+    get_project_name,
+)
+
+
+class _FakeNode:
+    def __init__(self, scope, context):
+        self._scope = scope
+        self._context = context
+        self.lookups = 0
+
+    @property
+    def root(self):
+        return self._scope
+
+    def try_get_context(self, key):
+        self.lookups += 1
+        return self._context.get(key)
+
+
+class _FakeApp:
+    """Stand-in for an App: its own root, with a context tree"""
+    def __init__(self, environments):
+        self.node = _FakeNode(self, {"environments": environments})
+
+
+def _environments(network=None):
+    return {
+        "projectName": "marti",
+        "dev": {"network": network or {"maxAzs": 2, "natGateways": 1}},
+    }
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+def test_same_root_hits_cache():
+    app = _FakeApp(_environments())
+    first = get_env_config(app, "dev")
+    assert get_env_config(app, "dev") is first
+    assert app.node.lookups == 1
+
+
+def test_different_root_misses_cache():
+    first = _FakeApp(_environments())
+    second = _FakeApp({"projectName": "other"})
+    assert get_project_name(first) == "marti"
+    assert get_project_name(second) == "other"
+
+
+def test_reused_root_id_misses_cache():
+    app = _FakeApp(_environments())
+    stale = _FakeApp({"projectName": "stale"})
+    # Simulate a freed root whose id() was handed to the new app
+    config._config_cache[("get_project_name", id(app))] = (stale, "stale")
+    assert get_project_name(app) == "marti"
+
+
+def test_clear_config_cache():
+    app = _FakeApp(_environments())
+    get_env_config(app, "dev")
+    clear_config_cache()
+    get_env_config(app, "dev")
+    assert app.node.lookups == 2
+
+
+def test_network_config_defaults_to_new_vpc():
+    network = get_network_config(_FakeApp(_environments()), "dev")
+    assert network.max_azs == 2
+    assert network.nat_gateways == 1
+    assert not network.use_existing_vpc
+    assert network.vpc_id is None
+
+
+def test_existing_vpc_requires_vpc_id():
+    app = _FakeApp(_environments({"maxAzs": 2, "natGateways": 1, "useExistingVpc": True}))
+    with pytest.raises(ValueError, match="network.useExistingVpc requires network.vpcId"):
+        get_network_config(app, "dev")
+
+
+def test_existing_vpc_with_vpc_id():
+    app = _FakeApp(_environments({
+        "maxAzs": 2, "natGateways": 0, "useExistingVpc": True, "vpcId": "vpc-123",
+    }))
+    network = get_network_config(app, "dev")
+    assert network.use_existing_vpc
+    assert network.vpc_id == "vpc-123"